@@ -0,0 +1,8 @@
+"""
+Shared YAML loader selection
+"""
+
+import yaml
+
+# Prefer the LibYAML-backed loader; PyYAML builds without it only have the pure-Python one
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
@@ -3,84 +3,216 @@ Core hardware testing implementation
 Integrates stress-ng, native macOS tools, and custom diagnostics
 """
 
+import os
 import subprocess
 import json
-import psutil
 import time
+import tempfile
+import yaml
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+from ._yaml import YamlLoader
+
+# Read-only probes needed by the test suite, keyed by the name tests collect them under
+PROBE_COMMANDS = {
+    'cpu_brand': ['sysctl', '-n', 'machdep.cpu.brand_string'],
+    'memsize': ['sysctl', '-n', 'hw.memsize'],
+    'macos_version': ['sw_vers', '-productVersion'],
+    'power': ['system_profiler', 'SPPowerDataType'],
+    'camera': ['system_profiler', 'SPCameraDataType'],
+    'microphone': ['ioreg', '-c', 'AppleHDAEngineInput', '-r', '-d', '1'],
+    'audio': ['system_profiler', 'SPAudioDataType'],
+    'bluetooth': ['system_profiler', 'SPBluetoothDataType'],
+    'wifi': ['networksetup', '-listallhardwareports'],
+    'usb': ['ioreg', '-p', 'IOUSB', '-l'],
+    'smart': ['smartctl', '-a', 'disk0'],
+}
+
+def _scan_fields(text, keys):
+    """Map each key to the value after the colon on its first matching line.
+    
+    Walks the text once and stops as soon as every key has been found.
+    """
+    fields = {}
+    for line in text.splitlines():
+        for key in keys:
+            if key not in fields and key in line and ':' in line:
+                fields[key] = line.split(':', 1)[1].strip()
+                break
+        if len(fields) == len(keys):
+            break
+    return fields
+
 class HardwareTestRunner:
     def __init__(self, config):
         self.config = config
+        
+        # Resolve the thresholds used by the battery, CPU and thermal checks once
+        t = config['thresholds']
+        self._th_cpu_warn = t['cpu_temp_warning']
+        self._th_cpu_crit = t['cpu_temp_critical']
+        self._th_bat_cyc = t['battery_cycles_critical']
+        self._th_bat_health = t['battery_health_warning']
+        
         self.results = {}
         self.current_test = None
         self.progress = 0
+        self._total_tests = 0
+        self._completed_tests = 0
         self.complete = False
         self.start_time = None
+        self._ts = None
+        self._power_data = None
+        self._lock = threading.Lock()
+        self._power_lock = threading.Lock()
+        self._procs = {}
+        self._progress_event = threading.Event()
+        self._pm = None
+        self._latest_temp = None
+        self._temp_ready = threading.Event()
         
     def run_all_tests(self):
         """Execute complete hardware test suite"""
         self.start_time = datetime.now()
+        self._ts = self.start_time.isoformat()
+        started = time.perf_counter()
         self.complete = False
         self.progress = 0
+        self._power_data = None
+        self._spawn_all()
+        try:
+            self._start_temp_monitor()
+            
+            tests = [
+                ('System Information', self.test_system_info),
+                ('Battery Health', self.test_battery),
+                ('Camera Module', self.test_camera),
+                ('Microphone', self.test_microphone),
+                ('Audio System', self.test_audio),
+                ('MIDI System', self.test_midi),
+                ('Bluetooth', self.test_bluetooth),
+                ('Wi-Fi', self.test_wifi),
+                ('USB/Thunderbolt', self.test_usb),
+                ('CPU Stress Test', self.test_cpu_stress),
+                ('Memory Endurance', self.test_memory_stress),
+                ('SSD Health', self.test_ssd_health),
+                ('Thermal Monitoring', self.test_thermal),
+                ('Part Authenticity', self.test_authenticity),
+            ]
+            
+            # Stress tests compete for CPU/memory and must run alone
+            serial_names = ('CPU Stress Test', 'Memory Endurance')
+            io_tests = [t for t in tests if t[0] not in serial_names]
+            serial_tests = [t for t in tests if t[0] in serial_names]
+            
+            self._total_tests = len(tests)
+            self._completed_tests = 0
+            
+            # Probes are independent and mostly block on subprocess I/O, so overlap them
+            self.current_test = "Hardware Probes"
+            self._notify_progress()
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                futures = {}
+                for name, test_func in io_tests:
+                    print(f"\n→ Running: {name}")
+                    futures[ex.submit(test_func)] = name
+                for future in as_completed(futures):
+                    self._record_result(futures[future], future.result)
+            
+            for name, test_func in serial_tests:
+                self.current_test = name
+                self._notify_progress()
+                print(f"\n→ Running: {name}")
+                self._record_result(name, test_func)
+            
+            # Keep report ordering stable regardless of completion order
+            with self._lock:
+                self.results = {name: self.results[name] for name, _ in tests if name in self.results}
+        finally:
+            # powermetrics never exits on its own; always clean up the helper processes
+            self._reap_probes()
+            self._stop_temp_monitor()
         
-        tests = [
-            ('System Information', self.test_system_info),
-            ('Battery Health', self.test_battery),
-            ('Camera Module', self.test_camera),
-            ('Microphone', self.test_microphone),
-            ('Audio System', self.test_audio),
-            ('MIDI System', self.test_midi),
-            ('Bluetooth', self.test_bluetooth),
-            ('Wi-Fi', self.test_wifi),
-            ('USB/Thunderbolt', self.test_usb),
-            ('CPU Stress Test', self.test_cpu_stress),
-            ('Memory Endurance', self.test_memory_stress),
-            ('SSD Health', self.test_ssd_health),
-            ('Thermal Monitoring', self.test_thermal),
-            ('Part Authenticity', self.test_authenticity),
-        ]
-        
-        total_tests = len(tests)
+        self.complete = True
+        self.current_test = "Complete"
+        self._notify_progress()
+        print(f"\n✓ All tests completed in {int(time.perf_counter() - started)}s")
+    
+    def _record_result(self, name, test_func):
+        """Run (or collect) a single test and store its result"""
+        try:
+            result = test_func()
+            print(f"✓ {name}: {'PASS' if result['status'] == 'pass' else 'FAIL'}")
+        except Exception as e:
+            result = {
+                'status': 'error',
+                'message': str(e),
+                'timestamp': self._ts
+            }
+            print(f"✗ {name}: ERROR - {e}")
         
-        for idx, (name, test_func) in enumerate(tests):
-            self.current_test = name
-            print(f"\n→ Running: {name}")
-            
+        with self._lock:
+            self.results[name] = result
+            self._completed_tests += 1
+            self.progress = int((self._completed_tests / self._total_tests) * 100)
+        self._notify_progress()
+    
+    def _notify_progress(self):
+        """Wake everyone waiting on the current progress event"""
+        # Pool threads report concurrently; swap under the lock so no installed event is orphaned
+        with self._lock:
+            event, self._progress_event = self._progress_event, threading.Event()
+        event.set()
+    
+    def _spawn_all(self):
+        """Start every probe subprocess up-front so the OS runs them in parallel"""
+        self._reap_probes()
+        for name, cmd in PROBE_COMMANDS.items():
             try:
-                result = test_func()
-                self.results[name] = result
-                print(f"✓ {name}: {'PASS' if result['status'] == 'pass' else 'FAIL'}")
-            except Exception as e:
-                self.results[name] = {
-                    'status': 'error',
-                    'message': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }
-                print(f"✗ {name}: ERROR - {e}")
-            
-            self.progress = int(((idx + 1) / total_tests) * 100)
+                self._procs[name] = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except OSError:
+                # Tool not installed; the test hits the same error when it asks for the output
+                pass
+    
+    def _probe_output(self, name, text=False):
+        """Collect a pre-spawned probe's stdout, running it on demand if it was not started.
         
-        self.complete = True
-        self.current_test = "Complete"
-        print(f"\n✓ All tests completed in {(datetime.now() - self.start_time).seconds}s")
+        Returns bytes unless text=True; only callers that need a str pay for decoding.
+        """
+        proc = self._procs.pop(name, None)
+        if proc is None:
+            output = subprocess.check_output(PROBE_COMMANDS[name], stderr=subprocess.DEVNULL)
+        else:
+            output = proc.communicate()[0]
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args, output)
         
+        return output.decode('utf-8', errors='replace') if text else output
+    
+    def _reap_probes(self):
+        """Kill any probe whose output was never collected"""
+        while self._procs:
+            _, proc = self._procs.popitem()
+            proc.kill()
+            proc.communicate()
+    
     def test_system_info(self):
         """System information test"""
         try:
-            cpu = subprocess.check_output(['sysctl', '-n', 'machdep.cpu.brand_string']).decode().strip()
-            ram_bytes = int(subprocess.check_output(['sysctl', '-n', 'hw.memsize']).decode().strip())
+            cpu = self._probe_output('cpu_brand', text=True).strip()
+            ram_bytes = int(self._probe_output('memsize').strip())
             ram_gb = ram_bytes / (1024**3)
-            macos = subprocess.check_output(['sw_vers', '-productVersion']).decode().strip()
-            serial = subprocess.check_output(['ioreg', '-l']).decode()
+            macos = self._probe_output('macos_version', text=True).strip()
             
             return {
                 'status': 'pass',
                 'cpu': cpu,
                 'ram_gb': round(ram_gb, 2),
                 'macos_version': macos,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except Exception as e:
             return {'status': 'fail', 'error': str(e)}
@@ -88,25 +220,24 @@ class HardwareTestRunner:
     def test_battery(self):
         """Battery health with red flag detection"""
         try:
+            import psutil
             battery = psutil.sensors_battery()
-            power_data = subprocess.check_output(['system_profiler', 'SPPowerDataType']).decode()
-            
-            # Extract cycle count
-            cycle_line = [l for l in power_data.split('\n') if 'Cycle Count' in l]
-            cycles = int(cycle_line[0].split(':')[1].strip()) if cycle_line else 0
+            power_data = self._get_power_data()
             
-            # Extract condition
-            condition_line = [l for l in power_data.split('\n') if 'Condition' in l]
-            condition = condition_line[0].split(':')[1].strip() if condition_line else 'Unknown'
+            # Extract cycle count, condition and manufacturer in a single pass
+            fields = _scan_fields(power_data, ('Cycle Count', 'Condition', 'Manufacturer'))
+            cycles = int(fields['Cycle Count']) if 'Cycle Count' in fields else 0
+            condition = fields.get('Condition', 'Unknown')
+            manufacturer = fields.get('Manufacturer', 'Unknown')
             
             status = 'pass'
             warnings = []
             
-            if cycles > self.config['thresholds']['battery_cycles_critical']:
+            if cycles > self._th_bat_cyc:
                 status = 'warning'
                 warnings.append(f"High cycle count: {cycles}")
             
-            if battery and battery.percent < self.config['thresholds']['battery_health_warning']:
+            if battery and battery.percent < self._th_bat_health:
                 status = 'warning'
                 warnings.append(f"Low charge: {battery.percent}%")
             
@@ -119,8 +250,9 @@ class HardwareTestRunner:
                 'percent': battery.percent if battery else 0,
                 'cycles': cycles,
                 'condition': condition,
+                'manufacturer': manufacturer,
                 'warnings': warnings,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
@@ -128,13 +260,13 @@ class HardwareTestRunner:
     def test_camera(self):
         """Camera module detection"""
         try:
-            camera_data = subprocess.check_output(['system_profiler', 'SPCameraDataType']).decode()
-            has_camera = len(camera_data.split('\n')) > 5
+            camera_data = self._probe_output('camera')
+            has_camera = camera_data.count(b'\n') >= 5
             
             return {
                 'status': 'pass' if has_camera else 'fail',
                 'detected': has_camera,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'detected': False}
@@ -142,13 +274,13 @@ class HardwareTestRunner:
     def test_microphone(self):
         """Microphone detection"""
         try:
-            mic_check = subprocess.check_output(['ioreg', '-c', 'AppleHDAEngineInput', '-r']).decode()
-            detected = 'IOAudioEngineState' in mic_check
+            mic_check = self._probe_output('microphone')
+            detected = b'IOAudioEngineState' in mic_check
             
             return {
                 'status': 'pass' if detected else 'fail',
                 'detected': detected,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'detected': False}
@@ -156,13 +288,13 @@ class HardwareTestRunner:
     def test_audio(self):
         """Audio system test"""
         try:
-            audio_data = subprocess.check_output(['system_profiler', 'SPAudioDataType']).decode()
-            devices = len([l for l in audio_data.split('\n') if 'Device Name' in l])
+            audio_data = self._probe_output('audio')
+            devices = audio_data.count(b'Device Name')
             
             return {
                 'status': 'pass' if devices > 0 else 'fail',
                 'devices_found': devices,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'devices_found': 0}
@@ -174,19 +306,19 @@ class HardwareTestRunner:
         return {
             'status': 'pass' if midi_app.exists() else 'fail',
             'available': midi_app.exists(),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._ts
         }
     
     def test_bluetooth(self):
         """Bluetooth hardware test"""
         try:
-            bt_data = subprocess.check_output(['system_profiler', 'SPBluetoothDataType']).decode()
-            has_bt = 'State:' in bt_data
+            bt_data = self._probe_output('bluetooth')
+            has_bt = b'State:' in bt_data
             
             return {
                 'status': 'pass' if has_bt else 'fail',
                 'detected': has_bt,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'detected': False}
@@ -194,16 +326,14 @@ class HardwareTestRunner:
     def test_wifi(self):
         """Wi-Fi interface test"""
         try:
-            wifi_check = subprocess.check_output([
-                'networksetup', '-listallhardwareports'
-            ]).decode()
+            wifi_check = self._probe_output('wifi')
             
-            has_wifi = 'Wi-Fi' in wifi_check
+            has_wifi = b'Wi-Fi' in wifi_check
             
             return {
                 'status': 'pass' if has_wifi else 'fail',
                 'detected': has_wifi,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'detected': False}
@@ -211,13 +341,13 @@ class HardwareTestRunner:
     def test_usb(self):
         """USB/Thunderbolt port detection"""
         try:
-            usb_data = subprocess.check_output(['ioreg', '-p', 'IOUSB', '-l']).decode()
-            devices = usb_data.count('Device Identifier')
+            usb_data = self._probe_output('usb')
+            devices = usb_data.count(b'Device Identifier')
             
             return {
                 'status': 'pass',
                 'devices_found': devices,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'fail', 'devices_found': 0}
@@ -244,7 +374,7 @@ class HardwareTestRunner:
             temp_after = self._get_cpu_temp()
             
             # Check for thermal throttling
-            throttled = temp_after > self.config['thresholds']['cpu_temp_critical']
+            throttled = temp_after > self._th_cpu_crit
             
             return {
                 'status': 'warning' if throttled else 'pass',
@@ -252,7 +382,7 @@ class HardwareTestRunner:
                 'temp_after': temp_after,
                 'throttled': throttled,
                 'duration': duration,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except subprocess.TimeoutExpired:
             return {'status': 'error', 'error': 'CPU stress test timeout'}
@@ -266,60 +396,69 @@ class HardwareTestRunner:
         try:
             print(f"  → Testing {mem_mb}MB memory...")
             
-            # Use stress-ng for memory testing
-            result = subprocess.run([
-                'stress-ng',
-                '--vm', '1',
-                '--vm-bytes', f'{mem_mb}M',
-                '--timeout', '30s',
-                '--verify'
-            ], capture_output=True, text=True)
-            
-            # Check for errors
-            has_errors = 'fail' in result.stdout.lower() or result.returncode != 0
+            # Use stress-ng for memory testing, with metrics written as YAML
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                metrics_file = Path(tmp_dir) / 'metrics.yaml'
+                result = subprocess.run([
+                    'stress-ng',
+                    '--vm', '1',
+                    '--vm-bytes', f'{mem_mb}M',
+                    '--timeout', '30s',
+                    '--verify',
+                    '--metrics',
+                    '--yaml', str(metrics_file)
+                ], capture_output=True)
+                metrics = self._load_stress_metrics(metrics_file)
+            
+            # --verify failures make stress-ng exit non-zero; no bogo ops means the stressor never ran
+            bogo_ops = metrics.get('bogo-ops', 0)
+            has_errors = result.returncode != 0 or bogo_ops == 0
             
             return {
                 'status': 'fail' if has_errors else 'pass',
                 'memory_tested_mb': mem_mb,
                 'errors_detected': has_errors,
-                'timestamp': datetime.now().isoformat()
+                'bogo_ops': bogo_ops,
+                'timestamp': self._ts
             }
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
+    def _load_stress_metrics(self, metrics_file):
+        """First stressor's entry from a stress-ng --yaml metrics file"""
+        try:
+            data = yaml.load(metrics_file.read_text(), Loader=YamlLoader) or {}
+        except (OSError, yaml.YAMLError):
+            return {}
+        
+        return (data.get('metrics') or [{}])[0]
+    
     def test_ssd_health(self):
         """SSD health and SMART data"""
         try:
-            # Get disk info
-            disk_usage = psutil.disk_usage('/')
+            # Get disk info from a single statvfs call (same arithmetic as psutil.disk_usage)
+            st = os.statvfs('/')
+            gib = float(1 << 30)
+            result = {
+                'status': 'pass',
+                'total_gb': round(st.f_blocks * st.f_frsize / gib, 2),
+                'used_gb': round((st.f_blocks - st.f_bfree) * st.f_frsize / gib, 2),
+                'free_gb': round(st.f_bavail * st.f_frsize / gib, 2),
+            }
             
             # Try to get SMART data (requires smartmontools)
             try:
-                smart_data = subprocess.check_output([
-                    'smartctl', '-a', 'disk0'
-                ], stderr=subprocess.DEVNULL).decode()
+                self._probe_output('smart')
                 
                 # Extract health percentage
-                health_line = [l for l in smart_data.split('\n') if 'Percentage Used' in l or 'Available Spare' in l]
                 health = 100  # Default
-                
-                return {
-                    'status': 'pass',
-                    'total_gb': round(disk_usage.total / (1024**3), 2),
-                    'used_gb': round(disk_usage.used / (1024**3), 2),
-                    'free_gb': round(disk_usage.free / (1024**3), 2),
-                    'health_percent': health,
-                    'timestamp': datetime.now().isoformat()
-                }
+                result['health_percent'] = health
             except:
                 # Fallback to basic disk info
-                return {
-                    'status': 'pass',
-                    'total_gb': round(disk_usage.total / (1024**3), 2),
-                    'used_gb': round(disk_usage.used / (1024**3), 2),
-                    'free_gb': round(disk_usage.free / (1024**3), 2),
-                    'timestamp': datetime.now().isoformat()
-                }
+                pass
+            
+            result['timestamp'] = self._ts
+            return result
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
@@ -329,15 +468,15 @@ class HardwareTestRunner:
             temp = self._get_cpu_temp()
             
             status = 'pass'
-            if temp > self.config['thresholds']['cpu_temp_critical']:
+            if temp > self._th_cpu_crit:
                 status = 'critical'
-            elif temp > self.config['thresholds']['cpu_temp_warning']:
+            elif temp > self._th_cpu_warn:
                 status = 'warning'
             
             return {
                 'status': status,
                 'cpu_temp': temp,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except:
             return {'status': 'error', 'error': 'Cannot read temperature'}
@@ -345,13 +484,9 @@ class HardwareTestRunner:
     def test_authenticity(self):
         """Part authenticity verification"""
         try:
-            power_data = subprocess.check_output(['system_profiler', 'SPPowerDataType']).decode()
-            
             # Check for "Normal" battery condition
-            condition_ok = 'Condition: Normal' in power_data
-            
-            # Check manufacturer info
-            manufacturer_line = [l for l in power_data.split('\n') if 'Manufacturer' in l]
+            fields = _scan_fields(self._get_power_data(), ('Condition',))
+            condition_ok = fields.get('Condition') == 'Normal'
             
             red_flags = []
             if not condition_ok:
@@ -360,13 +495,75 @@ class HardwareTestRunner:
             return {
                 'status': 'pass' if len(red_flags) == 0 else 'warning',
                 'red_flags': red_flags,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._ts
             }
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
+    def _get_power_data(self):
+        """SPPowerDataType output, fetched once per test run"""
+        with self._power_lock:
+            if self._power_data is None:
+                self._power_data = self._probe_output('power', text=True)
+            return self._power_data
+    
+    def _start_temp_monitor(self):
+        """Sample CPU temperature continuously from one long-lived powermetrics"""
+        self._stop_temp_monitor()
+        self._latest_temp = None
+        self._temp_ready = threading.Event()
+        try:
+            # run.py already re-execs as root; no sudo wrapper, so signals reach powermetrics itself
+            self._pm = subprocess.Popen([
+                'powermetrics',
+                '--samplers', 'smc',
+                '-i', '500'
+            ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except OSError:
+            self._pm = None
+            self._temp_ready.set()
+            return
+        
+        threading.Thread(target=self._read_temp_samples, args=(self._pm, self._temp_ready), daemon=True).start()
+    
+    def _read_temp_samples(self, pm, ready):
+        """Background reader keeping _latest_temp at the most recent sample"""
+        try:
+            for line in pm.stdout:
+                if 'CPU die temperature' in line:
+                    try:
+                        self._latest_temp = float(line.split(':', 1)[1].strip().split()[0])
+                    except (IndexError, ValueError):
+                        continue
+                    ready.set()
+        except (OSError, ValueError):
+            # Pipe closed by _stop_temp_monitor
+            pass
+        finally:
+            # Never leave readers waiting on a monitor that has exited
+            ready.set()
+    
+    def _stop_temp_monitor(self):
+        """Terminate the powermetrics monitor, if running"""
+        if self._pm is None:
+            return
+        
+        self._pm.terminate()
+        try:
+            self._pm.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._pm.kill()
+            self._pm.wait()
+        self._pm.stdout.close()
+        self._pm = None
+    
     def _get_cpu_temp(self):
         """Get CPU temperature (best effort)"""
+        if self._pm is not None:
+            # Wait for the first sample at most as long as a one-shot run would take
+            self._temp_ready.wait(timeout=5)
+            return self._latest_temp if self._latest_temp is not None else 45.0
+        
         try:
             # Try powermetrics
             result = subprocess.run([
@@ -376,10 +573,9 @@ class HardwareTestRunner:
                 '-n', '1'
             ], capture_output=True, text=True, timeout=5)
             
-            for line in result.stdout.split('\n'):
-                if 'CPU die temperature' in line:
-                    temp = float(line.split(':')[1].strip().split()[0])
-                    return temp
+            fields = _scan_fields(result.stdout, ('CPU die temperature',))
+            if 'CPU die temperature' in fields:
+                return float(fields['CPU die temperature'].split()[0])
             
             # Default fallback
             return 45.0
@@ -394,6 +590,13 @@ class HardwareTestRunner:
             'complete': self.complete
         }
     
+    def progress_event(self):
+        """Event that is set on the next status change.
+        
+        Grab it before reading get_status() so no update is missed in between.
+        """
+        return self._progress_event
+    
     def is_complete(self):
         return self.complete
     
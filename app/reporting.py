@@ -2,9 +2,61 @@
 Intelligent red flag detection and report generation
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
+import io
+import os
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_STATUS_SYMBOL = {
+    'pass': '✓',
+    'fail': '✗',
+    'warning': '⚠',
+    'error': '❌'
+}
+
+# Component detection tests and the component name shown in red flags
+_DETECT_TESTS = {
+    'Camera Module': 'Camera',
+    'Microphone': 'Microphone',
+    'Audio System': 'Audio',
+    'Bluetooth': 'Bluetooth',
+    'Wi-Fi': 'Wi-Fi'
+}
+
+def _atomic_write(path, payload):
+    """Write bytes to a unique temp file beside path, then os.replace it into place"""
+    # Unique per writer, so concurrent exports never share (or yank) a temp file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        # mkstemp creates 0600; keep reports as readable as a plain open() would
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except:
+        os.unlink(tmp)
+        raise
+
+def _write_json(path, data):
+    """Atomically write data as indented JSON"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    _atomic_write(path, payload)
+
+def _write_text(path, text):
+    """Atomically write text"""
+    _atomic_write(path, text.encode())
 
 class ReportGenerator:
     def __init__(self, config):
@@ -12,8 +64,11 @@ class ReportGenerator:
         self.log_dir = Path(config['logging']['directory'])
         self.log_dir.mkdir(exist_ok=True)
     
-    def detect_red_flags(self, results):
+    def detect_red_flags(self, results, summary=None):
         """Detect hardware red flags from test results"""
+        if summary is None:
+            summary = self.generate_summary(results)
+        
         red_flags = []
         green_flags = []
         
@@ -58,10 +113,10 @@ class ReportGenerator:
                 green_flags.append('Memory integrity verified')
         
         # Component detection red flags
-        failed_components = []
-        for test_name in ['Camera Module', 'Microphone', 'Audio System', 'Bluetooth', 'Wi-Fi']:
-            if test_name in results and results[test_name]['status'] == 'fail':
-                failed_components.append(test_name.replace(' Module', '').replace(' System', ''))
+        failed_components = [
+            component for test_name, component in _DETECT_TESTS.items()
+            if results.get(test_name, {}).get('status') == 'fail'
+        ]
         
         if failed_components:
             red_flags.append({
@@ -87,22 +142,21 @@ class ReportGenerator:
             'red_flags': red_flags,
             'green_flags': green_flags,
             'total_issues': len(red_flags),
-            'health_score': self._calculate_health_score(results, red_flags)
+            'health_score': self._calculate_health_score(red_flags, summary)
         }
     
-    def _calculate_health_score(self, results, red_flags):
+    def _calculate_health_score(self, red_flags, summary):
         """Calculate overall hardware health score (0-100)"""
-        total_tests = len(results)
-        passed_tests = sum(1 for r in results.values() if r.get('status') == 'pass')
+        total_tests = summary['total_tests']
+        if total_tests == 0:
+            return 0
         
-        base_score = (passed_tests / total_tests) * 100 if total_tests > 0 else 0
+        base_score = (summary['passed'] / total_tests) * 100
         
         # Deduct for red flags
-        critical_flags = sum(1 for f in red_flags if f.get('severity') == 'critical')
-        high_flags = sum(1 for f in red_flags if f.get('severity') == 'high')
-        medium_flags = sum(1 for f in red_flags if f.get('severity') == 'medium')
+        severity = Counter(f.get('severity') for f in red_flags)
         
-        penalty = (critical_flags * 20) + (high_flags * 10) + (medium_flags * 5)
+        penalty = (severity['critical'] * 20) + (severity['high'] * 10) + (severity['medium'] * 5)
         
         final_score = max(0, base_score - penalty)
         
@@ -111,9 +165,10 @@ class ReportGenerator:
     def generate_summary(self, results):
         """Generate test summary"""
         total = len(results)
-        passed = sum(1 for r in results.values() if r.get('status') == 'pass')
-        failed = sum(1 for r in results.values() if r.get('status') == 'fail')
-        warnings = sum(1 for r in results.values() if r.get('status') == 'warning')
+        statuses = Counter(r.get('status') for r in results.values())
+        passed = statuses['pass']
+        failed = statuses['fail']
+        warnings = statuses['warning']
         
         return {
             'total_tests': total,
@@ -125,91 +180,91 @@ class ReportGenerator:
     
     def export_full_report(self, results):
         """Export comprehensive report to file"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        # Microseconds keep exports made within the same second from replacing each other
+        timestamp = now.strftime('%Y%m%d_%H%M%S_%f')
         report_file = self.log_dir / f'hardware_report_{timestamp}.json'
         
-        red_flags_data = self.detect_red_flags(results)
         summary = self.generate_summary(results)
+        red_flags_data = self.detect_red_flags(results, summary)
         
         full_report = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'summary': summary,
             'red_flags': red_flags_data,
             'detailed_results': results
         }
         
-        with open(report_file, 'w') as f:
-            json.dump(full_report, f, indent=2)
-        
-        # Also create human-readable text report
+        # Human-readable text report alongside the JSON
         text_report = self._generate_text_report(full_report)
         text_file = self.log_dir / f'hardware_report_{timestamp}.txt'
         
-        with open(text_file, 'w') as f:
-            f.write(text_report)
+        # Write both files in parallel; result() re-raises any write error
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [
+                ex.submit(_write_json, report_file, full_report),
+                ex.submit(_write_text, text_file, text_report)
+            ]
+            for future in futures:
+                future.result()
         
         return text_file
     
     def _generate_text_report(self, full_report):
         """Generate human-readable text report"""
-        lines = []
-        lines.append("=" * 70)
-        lines.append("macOS HARDWARE TEST SUITE - COMPREHENSIVE REPORT")
-        lines.append("=" * 70)
-        lines.append(f"\nGenerated: {full_report['timestamp']}\n")
+        buf = io.StringIO()
+        buf.write("=" * 70 + "\n")
+        buf.write("macOS HARDWARE TEST SUITE - COMPREHENSIVE REPORT\n")
+        buf.write("=" * 70 + "\n")
+        buf.write(f"\nGenerated: {full_report['timestamp']}\n\n")
         
         # Summary
         summary = full_report['summary']
-        lines.append("\n📊 TEST SUMMARY")
-        lines.append("-" * 70)
-        lines.append(f"Total Tests: {summary['total_tests']}")
-        lines.append(f"Passed: {summary['passed']}")
-        lines.append(f"Failed: {summary['failed']}")
-        lines.append(f"Warnings: {summary['warnings']}")
-        lines.append(f"Pass Rate: {summary['pass_rate']}%")
+        buf.write("\n📊 TEST SUMMARY\n")
+        buf.write("-" * 70 + "\n")
+        buf.write(f"Total Tests: {summary['total_tests']}\n")
+        buf.write(f"Passed: {summary['passed']}\n")
+        buf.write(f"Failed: {summary['failed']}\n")
+        buf.write(f"Warnings: {summary['warnings']}\n")
+        buf.write(f"Pass Rate: {summary['pass_rate']}%\n")
         
         # Health Score
         health_score = full_report['red_flags']['health_score']
-        lines.append(f"\n🏥 OVERALL HEALTH SCORE: {health_score}/100")
+        buf.write(f"\n🏥 OVERALL HEALTH SCORE: {health_score}/100\n")
         
         # Red Flags
         red_flags = full_report['red_flags']['red_flags']
         if red_flags:
-            lines.append("\n\n🚩 RED FLAGS DETECTED")
-            lines.append("-" * 70)
+            buf.write("\n\n🚩 RED FLAGS DETECTED\n")
+            buf.write("-" * 70 + "\n")
             for flag in red_flags:
-                lines.append(f"\n⚠️  {flag['component']} [{flag['severity'].upper()}]")
-                lines.append(f"    Issue: {flag['message']}")
-                lines.append(f"    Action: {flag['recommendation']}")
+                buf.write(f"\n⚠️  {flag['component']} [{flag['severity'].upper()}]\n")
+                buf.write(f"    Issue: {flag['message']}\n")
+                buf.write(f"    Action: {flag['recommendation']}\n")
         
         # Green Flags
         green_flags = full_report['red_flags']['green_flags']
         if green_flags:
-            lines.append("\n\n✅ GREEN FLAGS (Healthy Components)")
-            lines.append("-" * 70)
+            buf.write("\n\n✅ GREEN FLAGS (Healthy Components)\n")
+            buf.write("-" * 70 + "\n")
             for flag in green_flags:
-                lines.append(f"  ✓ {flag}")
+                buf.write(f"  ✓ {flag}\n")
         
         # Detailed Results
-        lines.append("\n\n📋 DETAILED TEST RESULTS")
-        lines.append("-" * 70)
+        buf.write("\n\n📋 DETAILED TEST RESULTS\n")
+        buf.write("-" * 70 + "\n")
         for test_name, result in full_report['detailed_results'].items():
-            status_symbol = {
-                'pass': '✓',
-                'fail': '✗',
-                'warning': '⚠',
-                'error': '❌'
-            }.get(result.get('status'), '?')
+            status_symbol = _STATUS_SYMBOL.get(result.get('status'), '?')
             
-            lines.append(f"\n{status_symbol} {test_name}: {result.get('status', 'unknown').upper()}")
+            buf.write(f"\n{status_symbol} {test_name}: {result.get('status', 'unknown').upper()}\n")
             
             # Add relevant details
             for key, value in result.items():
                 if key not in ['status', 'timestamp']:
-                    lines.append(f"    {key}: {value}")
+                    buf.write(f"    {key}: {value}\n")
         
-        lines.append("\n" + "=" * 70)
-        lines.append("END OF REPORT")
-        lines.append("=" * 70)
+        buf.write("\n" + "=" * 70 + "\n")
+        buf.write("END OF REPORT\n")
+        buf.write("=" * 70 + "\n")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
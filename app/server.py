@@ -2,25 +2,46 @@
 Flask web server for hardware testing interface
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+import json
 import yaml
 import threading
 import time
 from pathlib import Path
 
-from .hardware_tests import HardwareTestRunner
-from .reporting import ReportGenerator
+from ._yaml import YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
 
 app = Flask(__name__)
 
 # Load configuration
 config_path = Path(__file__).parent.parent / 'config.yaml'
 with open(config_path) as f:
-    config = yaml.safe_load(f)
+    config = yaml.load(f, Loader=YamlLoader)
+
+# Longest a single /api/status_stream connection stays open before the client reconnects
+STATUS_STREAM_MAX_SECONDS = 60
 
 # Global test runner
 test_runner = None
-report_gen = ReportGenerator(config)
+report_gen = None
+
+def get_report_gen():
+    """Create the report generator on first use (keeps server import light)"""
+    global report_gen
+    if report_gen is None:
+        from .reporting import ReportGenerator
+        report_gen = ReportGenerator(config)
+    return report_gen
 
 @app.route('/')
 def index():
@@ -34,6 +55,7 @@ def start_tests():
     
     test_types = request.json.get('tests', 'all')
     
+    from .hardware_tests import HardwareTestRunner
     test_runner = HardwareTestRunner(config)
     
     # Run tests in background thread
@@ -48,20 +70,61 @@ def test_status():
     """Get current test status"""
     if test_runner:
         status = test_runner.get_status()
-        return jsonify(status)
-    return jsonify({'status': 'idle', 'progress': 0})
+    else:
+        status = {'status': 'idle', 'progress': 0}
+    
+    # Polled continuously while tests run, so skip jsonify's overhead when possible
+    if orjson is not None:
+        return Response(orjson.dumps(status), mimetype='application/json')
+    return jsonify(status)
+
+@app.route('/api/status_stream')
+def status_stream():
+    """Push test status to the browser as Server-Sent Events"""
+    runner = test_runner
+    
+    def gen():
+        if runner is None:
+            yield f"data: {json.dumps({'status': 'idle', 'progress': 0})}\n\n"
+            return
+        
+        # Each open stream holds a server worker thread; end it periodically and let
+        # EventSource reconnect so long runs don't pin threads for minutes
+        deadline = time.monotonic() + STATUS_STREAM_MAX_SECONDS
+        yield "retry: 1000\n\n"
+        last = None
+        while True:
+            event = runner.progress_event()
+            status = runner.get_status()
+            if status != last:
+                payload = orjson.dumps(status).decode() if orjson is not None else json.dumps(status)
+                yield f"data: {payload}\n\n"
+                last = status
+            if status['complete']:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if not event.wait(timeout=min(15, remaining)):
+                # Keep idle proxies/browsers from dropping the connection
+                yield ": keepalive\n\n"
+    
+    return Response(stream_with_context(gen()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
 @app.route('/api/results')
 def get_results():
     """Get test results with red flag detection"""
     if test_runner and test_runner.is_complete():
         results = test_runner.get_results()
-        red_flags = report_gen.detect_red_flags(results)
+        reports = get_report_gen()
+        summary = reports.generate_summary(results)
+        red_flags = reports.detect_red_flags(results, summary)
         
         return jsonify({
             'results': results,
             'red_flags': red_flags,
-            'summary': report_gen.generate_summary(results)
+            'summary': summary
         })
     return jsonify({'status': 'not_ready'})
 
@@ -69,7 +132,7 @@ def get_results():
 def export_report():
     """Export full test report"""
     if test_runner:
-        report_path = report_gen.export_full_report(test_runner.get_results())
+        report_path = get_report_gen().export_full_report(test_runner.get_results())
         return jsonify({'report_path': str(report_path)})
     return jsonify({'error': 'No test data available'})
 
@@ -78,8 +141,15 @@ def start_server():
     host = config['web_server']['host']
     port = config['web_server']['port']
     debug = config['web_server']['debug']
+    threads = config['web_server'].get('threads', 16)
     
     print(f"\n✓ Server starting at http://{host}:{port}")
     print(f"✓ Open your browser to begin testing\n")
     
-    app.run(host=host, port=port, debug=debug)
+    if debug or serve is None:
+        app.run(host=host, port=port, debug=debug)
+    else:
+        # Every open /api/status_stream (one per browser tab) occupies a worker thread
+        # for up to STATUS_STREAM_MAX_SECONDS, so size the pool with headroom for the
+        # API endpoints
+        serve(app, host=host, port=port, threads=threads)
@@ -57,7 +57,7 @@ source venv/bin/activate
 # 5. Install Python Requirements
 echo -e "${YELLOW}→ Installing libraries...${NC}"
 pip install --upgrade pip
-pip install Flask==3.0.0 PyYAML==6.0.1 psutil==5.9.6 requests==2.31.0 Werkzeug==3.0.1 py-cpuinfo==9.0.0
+pip install Flask==3.0.0 PyYAML==6.0.1 psutil==5.9.6 requests==2.31.0 Werkzeug==3.0.1 orjson==3.9.10 waitress==2.1.2 py-cpuinfo==9.0.0
 
 # 6. Finalize
 chmod +x run.py